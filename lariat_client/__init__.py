@@ -11,6 +11,7 @@ from .lariat_client import (
     MetricRecord,
     MetricRecordList,
     RawDataset,
+    clear_metadata_cache,
     get_dataset,
     get_datasets,
     get_raw_datasets,
@@ -0,0 +1,316 @@
+"""
+Asynchronous counterparts to the Lariat API client, built on aiohttp.
+
+Each coroutine mirrors a blocking function from ``lariat_client`` (``aquery``
+corresponds to ``query``, ``aget_indicators`` to ``get_indicators``, and so
+on) and shares its credential configuration: ``lariat_client.configure()``
+applies to both. Sessions are created lazily per running event loop, so many
+calls can be overlapped with ``asyncio.gather``.
+"""
+
+import asyncio
+import datetime
+import logging
+from typing import Any, Dict, List, Union
+
+import aiohttp
+
+from .lariat_client import (
+    LARIAT_PUBLIC_API_ENDPOINT,
+    Dataset,
+    Field,
+    Filter,
+    Indicator,
+    MetricRecordList,
+    RawDataset,
+    _dataset_from_obj,
+    _dumps,
+    _indicator_from_obj,
+    _loads,
+    _metric_query_data,
+    _raw_dataset_from_obj,
+    s,
+)
+
+logger = logging.getLogger(__name__)
+
+_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """
+    Gets the aiohttp session bound to the running event loop, creating it on
+    first use. The session inherits the credential headers of the shared
+    blocking session, so configure() applies here as well.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        # aiohttp negotiates its own connection and content encoding; only
+        # carry over the credential and content-type headers.
+        headers = {
+            name: value
+            for name, value in s.headers.items()
+            if name not in ("Connection", "Accept-Encoding")
+        }
+        session = aiohttp.ClientSession(
+            headers=headers,
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30),
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def aclose():
+    """
+    Closes the aiohttp session bound to the running event loop, if any.
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def _request(method: str, path: str, **kwargs) -> Any:
+    """
+    Issues a request against the Lariat API and decodes the response.
+
+    Args:
+        method (str): The HTTP method to use.
+        path (str): The API path to request, e.g. '/indicators'.
+        **kwargs: Additional arguments forwarded to the session's request call.
+
+    Returns:
+        The decoded response payload, or None if the request failed.
+    """
+    try:
+        session = _get_session()
+        async with session.request(
+            method, f"{LARIAT_PUBLIC_API_ENDPOINT}{path}", **kwargs
+        ) as r:
+            r.raise_for_status()
+            return _loads(await r.read())
+    except aiohttp.ClientResponseError as errh:
+        logger.error("Http Error: %s", errh)
+    except aiohttp.ClientConnectionError as errc:
+        logger.error("Error Connecting: %s", errc)
+    except asyncio.TimeoutError as errt:
+        logger.error("Timeout Error: %s", errt)
+    except aiohttp.ClientError as err:
+        logger.error("Something went wrong: %s", err)
+    # ValueError covers malformed response bodies: both orjson's and the
+    # stdlib's JSONDecodeError subclass it.
+    except ValueError as errj:
+        logger.error("Invalid JSON Body: %s", errj)
+    return None
+
+
+async def _get(path: str, **kwargs) -> Any:
+    return await _request("GET", path, **kwargs)
+
+
+async def _post(path: str, **kwargs) -> Any:
+    body = kwargs.pop("json", None)
+    if body is not None:
+        kwargs["data"] = _dumps(body)
+        kwargs.setdefault("headers", {"Content-Type": "application/json"})
+    return await _request("POST", path, **kwargs)
+
+
+async def aget_raw_datasets(dataset_ids: List[int]) -> List[RawDataset]:
+    """
+    Gets the raw datasets given a list of dataset ids.
+
+    Args:
+        dataset_ids (list): A list of dataset ids to filter on.
+
+    Returns:
+        List[RawDataset]: A list of raw datasets that the provided dataset_ids are created from.
+    """
+    params = [("dataset_id", str(dataset_id)) for dataset_id in dataset_ids]
+    payload = await _get("/raw-datasets", params=params)
+    if payload is None:
+        return None
+    return [_raw_dataset_from_obj(obj) for obj in payload["raw_datasets"]]
+
+
+async def aget_dataset(name: str, source_id: str) -> Union[Dataset, None]:
+    """
+    Gets the dataset corresponding to a given name source_id.
+
+    Args:
+        name: The name of the dataset.
+        source_id: The source of the dataset.
+
+    Returns:
+        Union[Dataset,None]: A dataset corresponding to the given name and source.
+    """
+    payload = await _get("/datasets", params={"source_id": source_id, "name": name})
+    if payload:
+        return _dataset_from_obj(payload["computed_datasets"][0])
+    return None
+
+
+async def aget_datasets(name: str = None) -> List[Dataset]:
+    """
+    Gets the datasets corresponding to an optional name.
+
+    Args:
+        name (optional str): The name of the dataset.
+
+    Returns:
+        List[Dataset]: A list of datasets belonging to the user.
+    """
+    params = {"name": name} if name else {}
+    payload = await _get("/datasets", params=params)
+    if payload is None:
+        return None
+    return [_dataset_from_obj(obj) for obj in payload["computed_datasets"]]
+
+
+async def aget_indicators(
+    datasets: List[Dataset] = None, tags: List[str] = None, fields: List[Field] = None
+) -> List[Indicator]:
+    """
+    Gets the indicators corresponding to optional filters.
+
+    Args:
+        datasets (list): A list of datasets to get corresponding indicators for.
+        tags (list): A list of tags to filter the indicators by.
+        fields (list): A list of fields that the indicators should include.
+
+    Returns:
+        List[Indicator]: A list of corresponding indicators.
+    """
+    params = []
+    if datasets:
+        params.extend(("dataset_id", str(dataset.id)) for dataset in datasets)
+    if tags:
+        params.extend(("tags", tag) for tag in tags)
+    if fields:
+        params.extend(("fields", field.name) for field in fields)
+    payload = await _get("/indicators", params=params)
+    if payload is None:
+        return None
+    return [_indicator_from_obj(obj) for obj in payload["indicators"]]
+
+
+async def aget_indicators_for_datasets(
+    datasets: List[Dataset], concurrency: int = 8
+) -> List[List[Indicator]]:
+    """
+    Fetches the indicators for many datasets concurrently.
+
+    Args:
+        datasets (list): The datasets to fetch indicators for.
+        concurrency (int): The maximum number of requests in flight at once,
+            bounding the fan-out to respect server rate limits.
+
+    Returns:
+        List[List[Indicator]]: One indicator list per dataset, in the order
+            the datasets were given.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(dataset: Dataset) -> List[Indicator]:
+        async with semaphore:
+            return await aget_indicators(datasets=[dataset])
+
+    return await asyncio.gather(*(one(dataset) for dataset in datasets))
+
+
+def get_indicators_for_datasets(
+    datasets: List[Dataset], concurrency: int = 8
+) -> List[List[Indicator]]:
+    """
+    Blocking wrapper around aget_indicators_for_datasets for callers without
+    a running event loop.
+    """
+
+    async def run():
+        try:
+            return await aget_indicators_for_datasets(datasets, concurrency)
+        finally:
+            await aclose()
+
+    return asyncio.run(run())
+
+
+async def aget_indicator(id: int) -> Indicator:
+    """
+    Gets the indicator corresponding to the provided id.
+
+    Args:
+        id (int): The indicator unique identifier.
+
+    Returns:
+        Indicator: The indicator corresponding to the provided id.
+    """
+    payload = await _get("/indicator", params={"indicator_id": str(id)})
+    if payload is None:
+        return None
+    return _indicator_from_obj(payload["indicator"])
+
+
+async def aquery(
+    indicator_id: int,
+    from_ts: datetime.datetime,
+    to_ts: datetime.datetime = None,
+    group_by: List[str] = None,
+    aggregate: str = None,
+    query_filter: Filter = None,
+) -> MetricRecordList:
+    """
+    Queries a provided indicator for its metric data.
+
+    Args:
+        indicator (indicator_id): Indicator id to query.
+        from_ts (datetime.datetime): The start time for the indicator evaluation.
+        to_ts (datetime.datetime): The end time for the indicator evaluation.
+        group_by (list): A list of strings to group the metrics data by.
+        aggregate (str): An optional aggregation function to apply to the metric.
+            Options for aggregate include ["sum","avg","median","p75","p25","max","min","count","distinct"]
+        query_filter (filter): A filter function to apply to the metric.
+
+    Returns:
+        MetricRecordList: An object that contains the list of records output by the query.
+    """
+    data, group_by = _metric_query_data(
+        indicator_id, from_ts, to_ts, group_by, aggregate, query_filter
+    )
+    payload = await _post("/query-metrics", json=data)
+    if payload is None:
+        return None
+    return MetricRecordList(group_by, payload["records"])
+
+
+async def aquery_streaming(
+    indicator_id: str,
+    from_ts: datetime.datetime,
+    to_ts: datetime.datetime = None,
+    group_by: List[str] = None,
+    aggregate: str = None,
+    query_filter: Filter = None,
+) -> MetricRecordList:
+    """
+    Queries a provided indicator for its streaming metric data.
+
+    Args:
+        indicator (indicator_id): Indicator id to query.
+        from_ts (datetime.datetime): The start time for the indicator evaluation.
+        to_ts (datetime.datetime): The end time for the indicator evaluation.
+        group_by (list): A list of strings to group the metrics data by.
+        aggregate (str): An optional aggregation function to apply to the metric.
+            Options for aggregate include ["sum","avg","median","p75","p25","max","min","count","distinct"]
+        query_filter (filter): A filter function to apply to the metric.
+
+    Returns:
+        MetricRecordList: An object that contains the list of records output by the query.
+    """
+    data, group_by = _metric_query_data(
+        indicator_id, from_ts, to_ts, group_by, aggregate, query_filter
+    )
+    payload = await _post("/streaming-query-metrics", json=data)
+    if payload is None:
+        return None
+    return MetricRecordList(group_by, payload["records"])
@@ -5,15 +5,36 @@ like querying indicators, fetching datasets, etc.
 
 import csv
 import datetime
+import functools
 from dotenv import load_dotenv
 import json
 import logging
 import os
-from typing import List, Dict, Any, Union
-import sys
-from flatten_json import flatten
-import pandas as pd
+import time
+from typing import List, Dict, Any, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+
+# urllib3 can only decode brotli responses when one of its optional backends
+# is installed, so only advertise it when that is the case.
+try:
+    import brotlicffi as _brotli
+except ImportError:
+    try:
+        import brotli as _brotli
+    except ImportError:
+        _brotli = None
 
 LARIAT_PUBLIC_API_ENDPOINT = "http://api.lariatdata.com/v1"
 load_dotenv()
@@ -22,13 +43,179 @@ application_key = os.getenv("LARIAT_APPLICATION_KEY")
 
 logger = logging.getLogger(__name__)
 
+
+def _repr(obj) -> str:
+    """
+    Builds a readable repr from a slotted object's attributes without paying
+    for JSON serialization.
+
+    Args:
+        obj: An instance of a class defining ``__slots__``.
+    """
+    attrs = ", ".join(f"{name}={getattr(obj, name)!r}" for name in obj.__slots__)
+    return f"{type(obj).__name__}({attrs})"
+
+
+def _iter_paths(d: Dict, prefix: str = ""):
+    """
+    Yields the dotted key paths of a nested dictionary without building an
+    intermediate flattened dictionary.
+
+    Args:
+        d (Dict): The nested dictionary to walk.
+        prefix (str): The dotted path accumulated so far.
+    """
+    for key, value in d.items():
+        path = key if not prefix else f"{prefix}.{key}"
+        if isinstance(value, dict) and value:
+            yield from _iter_paths(value, path)
+        else:
+            yield path
+
 s = requests.Session()
 s.headers.update(
     {
-        "X-Lariat-Application-Key": application_key,
-        "X-Lariat-Api-Key": api_key,
+        "Connection": "keep-alive",
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate, br" if _brotli is not None else "gzip, deflate",
     }
 )
+if api_key is not None and application_key is not None:
+    s.headers.update(
+        {
+            "X-Lariat-Application-Key": application_key,
+            "X-Lariat-Api-Key": api_key,
+        }
+    )
+_retry = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_retry)
+s.mount("http://", _adapter)
+s.mount("https://", _adapter)
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _to_ms(ts: Union[datetime.datetime, int]) -> int:
+    """
+    Converts a timestamp to epoch milliseconds.
+
+    Args:
+        ts (Union[datetime.datetime, int]): A datetime to convert, or an
+            already-converted epoch-millisecond integer which is returned
+            unchanged. Naive datetimes are interpreted as UTC.
+
+    Returns:
+        int: The timestamp in epoch milliseconds.
+    """
+    if isinstance(ts, int):
+        return ts
+    if ts.tzinfo is not None:
+        return int(ts.timestamp() * 1000)
+    return int((ts - _EPOCH).total_seconds() * 1000)
+
+
+def _indicator_query(obj: Dict) -> str:
+    """
+    Builds the SQL query string for an indicator payload returned by the API.
+
+    Args:
+        obj (Dict): An indicator object from an API response.
+
+    Returns:
+        str: The SQL query used to compute the indicator.
+    """
+    parts = [
+        f'SELECT {obj["calculation"]} AS value FROM "{obj["computed_dataset_name"]}"'
+    ]
+    if obj["filters"]:
+        parts.append(f'WHERE {obj["filters"]}')
+    if obj["group_fields"]:
+        parts.append(f'GROUP BY {",".join(obj["group_fields"])}')
+    return " ".join(parts)
+
+
+def _request(method: str, path: str, **kwargs) -> Any:
+    """
+    Issues a request against the Lariat API and decodes the response.
+
+    Args:
+        method (str): The HTTP method to use.
+        path (str): The API path to request, e.g. '/indicators'.
+        **kwargs: Additional arguments forwarded to the session's request call.
+
+    Returns:
+        The decoded response payload, or None if the request failed.
+    """
+    try:
+        r = s.request(method, f"{LARIAT_PUBLIC_API_ENDPOINT}{path}", **kwargs)
+        r.raise_for_status()
+        return _loads(r.content)
+    # ValueError covers malformed response bodies: both orjson's and the
+    # stdlib's JSONDecodeError subclass it.
+    except (RequestException, ValueError) as err:
+        logger.error("%s: %s", type(err).__name__, err)
+    return None
+
+
+_metadata_caches = []
+_METADATA_CACHE_MAXSIZE = 256
+
+
+def _cache_metadata(fn):
+    """
+    Memoizes a metadata lookup on its arguments.
+
+    Failed lookups (None results) are not cached, and calls with unhashable
+    arguments bypass the cache. Each cache holds at most
+    _METADATA_CACHE_MAXSIZE entries and is cleared when it would grow past
+    that. Cached objects are shared between callers; use
+    clear_metadata_cache() to force fresh lookups.
+    """
+    cache = {}
+    _metadata_caches.append(cache)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            if key in cache:
+                return cache[key]
+        except TypeError:
+            return fn(*args, **kwargs)
+        result = fn(*args, **kwargs)
+        if result is not None:
+            if len(cache) >= _METADATA_CACHE_MAXSIZE:
+                cache.clear()
+            cache[key] = result
+        return result
+
+    return wrapper
+
+
+def clear_metadata_cache():
+    """
+    Clears the cached results of get_indicator, get_dataset and get_datasets.
+    """
+    for cache in _metadata_caches:
+        cache.clear()
+
+
+def _get(path: str, **kwargs) -> Any:
+    return _request("GET", path, **kwargs)
+
+
+def _post(path: str, **kwargs) -> Any:
+    body = kwargs.pop("json", None)
+    if body is not None:
+        kwargs["data"] = _dumps(body)
+        kwargs.setdefault("headers", {"Content-Type": "application/json"})
+    return _request("POST", path, **kwargs)
 
 
 def configure(api_key: str, application_key: str):
@@ -55,12 +242,14 @@ class Field:
         name (str): The name of the field.
     """
 
+    __slots__ = ("dataset_id", "name")
+
     def __init__(self, dataset_id: int, name: str):
         self.dataset_id = dataset_id
         self.name = name
 
     def __repr__(self):
-        return json.dumps(self.__dict__)
+        return _repr(self)
 
 
 class Indicator:
@@ -77,6 +266,17 @@ class Indicator:
         tags (List[str]): The list of tags associated with the indicator.
     """
 
+    __slots__ = (
+        "id",
+        "dataset_id",
+        "dataset_name",
+        "query",
+        "aggregations",
+        "name",
+        "dimensions",
+        "tags",
+    )
+
     def __init__(
         self,
         id: int,
@@ -98,7 +298,7 @@ class Indicator:
         self.tags = tags
 
     def __repr__(self):
-        return json.dumps(self.__dict__)
+        return _repr(self)
 
     def get_dimension_values(
         self, dimensions: List[str] = None
@@ -113,22 +313,11 @@ class Indicator:
         Returns:
             Dict[str, List[str]]: A dictionary with dimension names as keys and lists of unique values as values.
         """
-        try:
-            r = s.get(
-                f"{LARIAT_PUBLIC_API_ENDPOINT}/indicators/{self.id}/dimensions",
-                params={"dimensions": dimensions},
-            )
-            r.raise_for_status()
-            return {obj["key"]: obj["values"] for obj in r.json()["filters"]}
-        except requests.exceptions.HTTPError as errh:
-            logging.error(f"Http Error: {errh}")
-        except requests.exceptions.ConnectionError as errc:
-            logging.error(f"Error Connecting: {errc}")
-        except requests.exceptions.Timeout as errt:
-            logging.error(f"Timeout Error: {errt}")
-        except requests.exceptions.RequestException as err:
-            logging.error(f"Something went wrong: {err}")
-            sys.exit(1)
+        params = {"dimensions": dimensions} if dimensions else {}
+        payload = _get(f"/indicators/{self.id}/dimensions", params=params)
+        if payload is None:
+            return None
+        return {obj["key"]: obj["values"] for obj in payload["filters"]}
 
 
 class RawDataset:
@@ -141,6 +330,8 @@ class RawDataset:
         schema (Dict): The schema of the raw dataset.
     """
 
+    __slots__ = ("source_id", "data_source", "name", "schema")
+
     def __init__(self, source_id: str, data_source: str, name: str, schema):
         self.source_id = source_id
         self.data_source = data_source
@@ -148,7 +339,7 @@ class RawDataset:
         self.schema = schema
 
     def __repr__(self):
-        return json.dumps(self.__dict__)
+        return _repr(self)
 
 
 class Dataset:
@@ -161,6 +352,8 @@ class Dataset:
         schema (Dict): The schema of the raw dataset.
     """
 
+    __slots__ = ("data_source", "source_id", "name", "id", "query", "schema")
+
     def __init__(
         self,
         data_source: str,
@@ -178,7 +371,7 @@ class Dataset:
         self.schema = schema
 
     def __repr__(self):
-        return json.dumps(self.__dict__)
+        return _repr(self)
 
     def get_schema(self) -> Dict:
         """
@@ -196,8 +389,10 @@ class Dataset:
         Returns:
             List[Field]: A list of the flattened schema fields of the dataset.
         """
-        flattened_keys = [flatten(d, ".") for d in [self.schema]][0].keys()
-        return [Field(dataset_id=self.id, name=field) for field in flattened_keys]
+        return [
+            Field(dataset_id=self.id, name=field)
+            for field in _iter_paths(self.schema)
+        ]
 
     def get_indicators(self) -> List[Indicator]:
         """
@@ -218,13 +413,15 @@ class FilterClause:
         values (list or str): A string or list of values to filter on.
     """
 
+    __slots__ = ("field", "operator", "values")
+
     def __init__(self, field: str, operator: str, values: Union[str, List[str]]):
         self.field = field
         self.operator = operator
         self.values = values
 
     def __repr__(self):
-        return json.dumps(self.__dict__)
+        return _repr(self)
 
 
 class Filter:
@@ -235,12 +432,14 @@ class Filter:
         operator (str): The operator to apply to the filter clauses. The options for this are [any, all]. The default operator is 'all'. 'any' corresponds to an "OR"ing of the clauses, and 'all' corresponds to an "AND"ing of the clauses
     """
 
+    __slots__ = ("clauses", "operator")
+
     def __init__(self, clauses: List[FilterClause], operator: str):
         self.clauses = clauses
         self.operator = operator
 
     def __repr__(self):
-        return json.dumps(self.__dict__)
+        return _repr(self)
 
 
 class MetricRecord:
@@ -252,13 +451,15 @@ class MetricRecord:
         dimensions (dict): A dictionary mapping of a metric's dimensional names to values.
     """
 
+    __slots__ = ("evaluation_time", "value", "dimensions")
+
     def __init__(self, evaluation_time: int, value: float, dimensions: Dict[str, str]):
         self.evaluation_time = evaluation_time
         self.value = value
         self.dimensions = dimensions
 
     def __repr__(self):
-        return json.dumps(self.__dict__)
+        return _repr(self)
 
     def to_dict(self) -> Dict[str, str]:
         """
@@ -277,8 +478,10 @@ class MetricRecord:
 class MetricRecordList:
     """A class representing a collection of metric records.
 
-    A MetricRecordList is printed out as a json string by default. It can be converted to a pandas dataframe
-    via the to_df() function and can be written out as a csv via the to_csv() function.
+    A MetricRecordList can be converted to a pandas dataframe via the to_df()
+    function and can be written out as a csv via the to_csv() function. Both
+    consume the raw records returned by the API; MetricRecord objects are
+    only materialized when the list is iterated or `records` is accessed.
 
     Attributes:
         group_by_fields (list): The epoch timestamp associated with the indicator's evaluation.
@@ -287,48 +490,85 @@ class MetricRecordList:
 
     def __init__(self, group_by_fields: List[str], records):
         self.group_by_fields = group_by_fields
-        if records:
-            self.records = [MetricRecord(**record) for record in records]
-        else:
-            self.records = []
-        self.index = 0
+        self._raw_records = records or []
+        self._records = None
+
+    @property
+    def records(self) -> List[MetricRecord]:
+        if self._records is None:
+            self._records = [MetricRecord(**record) for record in self._raw_records]
+        return self._records
 
     def __repr__(self):
-        return json.dumps(self.__dict__, default=lambda x: x.__dict__)
+        return (
+            f"MetricRecordList(group_by_fields={self.group_by_fields!r}, "
+            f"records={self._raw_records!r})"
+        )
 
     def __iter__(self):
-        return self
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self._raw_records)
 
-    def __next__(self):
-        if self.index >= len(self.records):
-            raise StopIteration
-        record = self.records[self.index]
-        self.index += 1
-        return record
+    def __getitem__(self, index):
+        return self.records[index]
 
-    def to_df(self) -> pd.DataFrame:
+    def to_df(self, value_dtype: str = "float32") -> "pd.DataFrame":
         """
         Converts the MetricRecord list into a pandas dataframe.
 
+        Args:
+            value_dtype (str): The dtype of the value column. Defaults to
+                'float32', which halves the column's memory; pass 'float64'
+                when full double precision is needed.
+
         Returns:
             Pandas DataFrame: A Dataframe consisting of the metric records returned by an indicator query.
         """
-        return pd.DataFrame.from_records([record.to_dict() for record in self.records])
+        # Imported here so that importing the module doesn't pay pandas'
+        # startup cost on call paths that never build a DataFrame.
+        import numpy as np
+        import pandas as pd
+
+        raw = self._raw_records
+        count = len(raw)
+        columns = {
+            "evaluation_time": np.fromiter(
+                (record["evaluation_time"] for record in raw),
+                dtype=np.int64,
+                count=count,
+            ),
+            "value": np.fromiter(
+                (record["value"] for record in raw),
+                dtype=np.dtype(value_dtype),
+                count=count,
+            ),
+        }
+        dimension_fields = self.group_by_fields
+        if not dimension_fields and raw:
+            dimension_fields = list(raw[0]["dimensions"])
+        for field in dimension_fields:
+            columns[field] = [record["dimensions"].get(field) for record in raw]
+        return pd.DataFrame(columns)
 
     def to_csv(self, filename, header=True):
         """
         Writes the MetricRecord list to a csv.
         """
+        group_by_fields = self.group_by_fields
         with open(filename, mode="w", newline="") as file:
             writer = csv.writer(file)
             if header:
-                output_array = ["evaluation_time", "value"]
-                for field in self.group_by_fields:
-                    output_array.append(field)
-                writer.writerow(output_array)
-            for record in self.records:
-                vals = record.to_dict()
-                writer.writerow([vals[field] for field in output_array])
+                writer.writerow(["evaluation_time", "value", *group_by_fields])
+            writer.writerows(
+                (
+                    record["evaluation_time"],
+                    record["value"],
+                    *(record["dimensions"].get(field) for field in group_by_fields),
+                )
+                for record in self._raw_records
+            )
 
 
 class RawQuery:
@@ -337,6 +577,16 @@ class RawQuery:
     A RawQuery may be sent to the API via `raw_query.send()` to retrive a `MetricRecordList`
     """
 
+    __slots__ = (
+        "indicator_id",
+        "from_ts",
+        "to_ts",
+        "group_by",
+        "aggregate",
+        "query_filter",
+        "metric_query_extra_args",
+    )
+
     def __init__(
         self,
         indicator_id: int,
@@ -368,14 +618,13 @@ class RawQuery:
 
         metric_query_extra_args = self.metric_query_extra_args
 
-        if to_ts is None:
-            to_ts = datetime.datetime.now()
+        to_ms = time.time_ns() // 1_000_000 if to_ts is None else _to_ms(to_ts)
         data_filter = {"operator": "or", "filters": []}
         if group_by:
             data_filter["group_by_clauses"] = group_by
         else:
             group_by = []
-        if query_filter:
+        if query_filter and query_filter.clauses:
             data_filter["operator"] = query_filter.operator
             data_filter["filters"] = [
                 {
@@ -389,8 +638,8 @@ class RawQuery:
             "indicator_id": indicator_id,
             "metric_query": {
                 "time_range": {
-                    "from_ts": int(from_ts.timestamp() * 1000),
-                    "to_ts": int(to_ts.timestamp() * 1000),
+                    "from_ts": _to_ms(from_ts),
+                    "to_ts": to_ms,
                 },
                 "query": data_filter,
             },
@@ -406,21 +655,93 @@ class RawQuery:
         return data
 
     def send(self) -> MetricRecordList:
-        try:
-            body = self.to_json()
-            group_by = self.group_by or []
-            r = s.get(url=f"{LARIAT_PUBLIC_API_ENDPOINT}/query-metrics-raw", json=body)
-            r.raise_for_status()
-            records = r.json()["records"]
-            return MetricRecordList(group_by, records)
-        except requests.exceptions.HTTPError as errh:
-            logging.error(f"Http Error: {errh}")
-        except requests.exceptions.ConnectionError as errc:
-            logging.error(f"Error Connecting: {errc}")
-        except requests.exceptions.Timeout as errt:
-            logging.error(f"Timeout Error: {errt}")
-        except requests.exceptions.RequestException as err:
-            logging.error(f"Something went wrong: {err}")
+        body = self.to_json()
+        group_by = self.group_by or []
+        payload = _post("/query-metrics-raw", json=body)
+        if payload is None:
+            return None
+        return MetricRecordList(group_by, payload["records"])
+
+
+def _raw_dataset_from_obj(obj: Dict) -> RawDataset:
+    """
+    Builds a RawDataset from a raw-dataset object in an API response.
+    """
+    return RawDataset(
+        source_id=obj["source_id"],
+        data_source=obj["data_source"],
+        name=obj["name"],
+        schema=obj["schema"],
+    )
+
+
+def _dataset_from_obj(obj: Dict) -> Dataset:
+    """
+    Builds a Dataset from a computed-dataset object in an API response.
+    """
+    return Dataset(
+        data_source=obj["data_source"],
+        source_id=obj["source_id"],
+        name=obj["dataset_name"],
+        id=obj["id"],
+        query=obj["query"],
+        schema=obj["schema"],
+    )
+
+
+def _indicator_from_obj(obj: Dict) -> Indicator:
+    """
+    Builds an Indicator from an indicator object in an API response.
+    """
+    return Indicator(
+        id=obj["indicator_id"],
+        dataset_id=obj["computed_dataset_id"],
+        dataset_name=obj["computed_dataset_name"],
+        query=_indicator_query(obj),
+        aggregations=obj.get("aggregations", []),
+        name=obj["name"],
+        dimensions=obj["group_fields"],
+        tags=obj.get("tags", []),
+    )
+
+
+def _metric_query_data(
+    indicator_id: Union[int, str],
+    from_ts: datetime.datetime,
+    to_ts: datetime.datetime,
+    group_by: List[str],
+    aggregate: str,
+    query_filter: Filter,
+) -> Tuple[Dict, List[str]]:
+    """
+    Builds the request body shared by the metric query endpoints.
+
+    Returns:
+        A tuple of the request body and the normalized group-by list.
+    """
+    to_ms = time.time_ns() // 1_000_000 if to_ts is None else _to_ms(to_ts)
+    data_filter = {"operator": "or", "filters": []}
+    if group_by:
+        data_filter["group_by_clauses"] = group_by
+    else:
+        group_by = []
+    if query_filter and query_filter.clauses:
+        data_filter["operator"] = query_filter.operator
+        data_filter["filters"] = [
+            {"field": clause.field, "operator": clause.operator, "value": clause.values}
+            for clause in query_filter.clauses
+        ]
+    data = {
+        "indicator_id": indicator_id,
+        "filter": data_filter,
+        "time_range": {
+            "from_ts": _to_ms(from_ts),
+            "to_ts": to_ms,
+        },
+    }
+    if aggregate:
+        data["aggregation"] = aggregate
+    return data, group_by
 
 
 def get_raw_datasets(dataset_ids: List[int]) -> List[RawDataset]:
@@ -433,32 +754,13 @@ def get_raw_datasets(dataset_ids: List[int]) -> List[RawDataset]:
     Returns:
         List[RawDataset]: A list of raw datasets that the provided dataset_ids are created from.
     """
-    try:
-        r = s.get(
-            f"{LARIAT_PUBLIC_API_ENDPOINT}/raw-datasets",
-            params={"dataset_id": dataset_ids},
-        )
-        r.raise_for_status()
-        return [
-            RawDataset(
-                source_id=obj["source_id"],
-                data_source=obj["data_source"],
-                name=obj["name"],
-                schema=obj["schema"],
-            )
-            for obj in r.json()["raw_datasets"]
-        ]
-    except requests.exceptions.HTTPError as errh:
-        logging.error(f"Http Error: {errh}")
-    except requests.exceptions.ConnectionError as errc:
-        logging.error(f"Error Connecting: {errc}")
-    except requests.exceptions.Timeout as errt:
-        logging.error(f"Timeout Error: {errt}")
-    except requests.exceptions.RequestException as err:
-        logging.error(f"Something went wrong: {err}")
-        sys.exit(1)
+    payload = _get("/raw-datasets", params={"dataset_id": dataset_ids})
+    if payload is None:
+        return None
+    return [_raw_dataset_from_obj(obj) for obj in payload["raw_datasets"]]
 
 
+@_cache_metadata
 def get_dataset(name: str, source_id: str) -> Union[Dataset, None]:
     """
     Gets the dataset corresponding to a given name source_id.
@@ -470,36 +772,13 @@ def get_dataset(name: str, source_id: str) -> Union[Dataset, None]:
     Returns:
         Union[Dataset,None]: A dataset corresponding to the given name and source.
     """
-    try:
-        r = s.get(
-            f"{LARIAT_PUBLIC_API_ENDPOINT}/datasets",
-            params={"source_id": source_id, "name": name},
-        )
-        r.raise_for_status()
-        if r.json():
-            return [
-                Dataset(
-                    data_source=obj["data_source"],
-                    source_id=obj["source_id"],
-                    name=obj["dataset_name"],
-                    id=obj["id"],
-                    query=obj["query"],
-                    schema=obj["schema"],
-                )
-                for obj in r.json()["computed_datasets"]
-            ][0]
-        return None
-    except requests.exceptions.HTTPError as errh:
-        logging.error(f"Http Error: {errh}")
-    except requests.exceptions.ConnectionError as errc:
-        logging.error(f"Error Connecting: {errc}")
-    except requests.exceptions.Timeout as errt:
-        logging.error(f"Timeout Error: {errt}")
-    except requests.exceptions.RequestException as err:
-        logging.error(f"Something went wrong: {err}")
-        sys.exit(1)
+    payload = _get("/datasets", params={"source_id": source_id, "name": name})
+    if payload:
+        return _dataset_from_obj(payload["computed_datasets"][0])
+    return None
 
 
+@_cache_metadata
 def get_datasets(name: str = None) -> List[Dataset]:
     """
     Gets the datasets corresponding to a given name source_id.
@@ -510,33 +789,14 @@ def get_datasets(name: str = None) -> List[Dataset]:
     Returns:
         List[Dataset]: A list of datasets belonging to the user.
     """
-    try:
-        r = s.get(f"{LARIAT_PUBLIC_API_ENDPOINT}/datasets", params={"name": name})
-        r.raise_for_status()
-        return [
-            Dataset(
-                data_source=obj["data_source"],
-                source_id=obj["source_id"],
-                name=obj["dataset_name"],
-                id=obj["id"],
-                query=obj["query"],
-                schema=obj["schema"],
-            )
-            for obj in r.json()["computed_datasets"]
-        ]
-    except requests.exceptions.HTTPError as errh:
-        logging.error(f"Http Error: {errh}")
-    except requests.exceptions.ConnectionError as errc:
-        logging.error(f"Error Connecting: {errc}")
-    except requests.exceptions.Timeout as errt:
-        logging.error(f"Timeout Error: {errt}")
-    except requests.exceptions.RequestException as err:
-        logging.error(f"Something went wrong: {err}")
-        sys.exit(1)
+    payload = _get("/datasets", params={"name": name})
+    if payload is None:
+        return None
+    return [_dataset_from_obj(obj) for obj in payload["computed_datasets"]]
 
 
 def get_indicators(
-    datasets: List[Dataset] = [], tags: List[str] = [], fields: List[Field] = []
+    datasets: List[Dataset] = None, tags: List[str] = None, fields: List[Field] = None
 ) -> List[Indicator]:
     """
     Gets the indicators corresponding to optional filters.
@@ -555,41 +815,14 @@ def get_indicators(
     if tags:
         params["tags"] = tags
     if fields:
-        params["fields"] = fields
-    try:
-        r = s.get(f"{LARIAT_PUBLIC_API_ENDPOINT}/indicators", params=params)
-        r.raise_for_status()
-        indicators = []
-        for obj in r.json()["indicators"]:
-            query = f'SELECT {obj["calculation"]} AS value FROM "{obj["computed_dataset_name"]}"'
-            if obj["filters"]:
-                query += f' WHERE {obj["filters"]}'
-            if obj["group_fields"]:
-                query += f' GROUP BY {obj["group_fields"]}'
-            indicators.append(
-                Indicator(
-                    id=obj["indicator_id"],
-                    dataset_id=obj["computed_dataset_id"],
-                    dataset_name=obj["computed_dataset_name"],
-                    query=query,
-                    aggregations=obj.get("aggregations", []),
-                    name=obj["name"],
-                    dimensions=obj["group_fields"],
-                    tags=obj.get("tags", []),
-                )
-            )
-        return indicators
-    except requests.exceptions.HTTPError as errh:
-        logging.error(f"Http Error: {errh}")
-    except requests.exceptions.ConnectionError as errc:
-        logging.error(f"Error Connecting: {errc}")
-    except requests.exceptions.Timeout as errt:
-        logging.error(f"Timeout Error: {errt}")
-    except requests.exceptions.RequestException as err:
-        logging.error(f"Something went wrong: {err}")
-        sys.exit(1)
+        params["fields"] = [field.name for field in fields]
+    payload = _get("/indicators", params=params)
+    if payload is None:
+        return None
+    return [_indicator_from_obj(obj) for obj in payload["indicators"]]
 
 
+@_cache_metadata
 def get_indicator(id: int) -> Indicator:
     """
     Gets the indicator corresponding to the provided id.
@@ -600,35 +833,10 @@ def get_indicator(id: int) -> Indicator:
     Returns:
         Indicator: The indicator corresponding to the provided id.
     """
-    params = {"indicator_id": id}
-    try:
-        r = s.get(f"{LARIAT_PUBLIC_API_ENDPOINT}/indicator", params=params)
-        r.raise_for_status()
-        obj = r.json()["indicator"]
-        query = f'SELECT {obj["calculation"]} AS value FROM "{obj["computed_dataset_name"]}"'
-        if obj["filters"]:
-            query += f' WHERE {obj["filters"]}'
-        if obj["group_fields"]:
-            query += f' GROUP BY {obj["group_fields"]}'
-        return Indicator(
-            id=obj["indicator_id"],
-            dataset_id=obj["computed_dataset_id"],
-            dataset_name=obj["computed_dataset_name"],
-            query=query,
-            aggregations=obj.get("aggregations", []),
-            name=obj["name"],
-            dimensions=obj["group_fields"],
-            tags=obj.get("tags", []),
-        )
-    except requests.exceptions.HTTPError as errh:
-        logging.error(f"Http Error: {errh}")
-    except requests.exceptions.ConnectionError as errc:
-        logging.error(f"Error Connecting: {errc}")
-    except requests.exceptions.Timeout as errt:
-        logging.error(f"Timeout Error: {errt}")
-    except requests.exceptions.RequestException as err:
-        logging.error(f"Something went wrong: {err}")
-        sys.exit(1)
+    payload = _get("/indicator", params={"indicator_id": id})
+    if payload is None:
+        return None
+    return _indicator_from_obj(payload["indicator"])
 
 
 def query(
@@ -654,43 +862,13 @@ def query(
     Returns:
         MetricRecordList: An object that contains the list of records output by the query.
     """
-    if to_ts is None:
-        to_ts = datetime.datetime.now()
-    data_filter = {"operator": "or", "filters": []}
-    if group_by:
-        data_filter["group_by_clauses"] = group_by
-    else:
-        group_by = []
-    if query_filter:
-        data_filter["operator"] = query_filter.operator
-        data_filter["filters"] = [
-            {"field": clause.field, "operator": clause.operator, "value": clause.values}
-            for clause in query_filter.clauses
-        ]
-    data = {
-        "indicator_id": indicator_id,
-        "filter": data_filter,
-        "time_range": {
-            "from_ts": int(from_ts.timestamp() * 1000),
-            "to_ts": int(to_ts.timestamp() * 1000),
-        },
-    }
-    if aggregate:
-        data["aggregation"] = aggregate
-    try:
-        r = s.get(url=f"{LARIAT_PUBLIC_API_ENDPOINT}/query-metrics", json=data)
-        r.raise_for_status()
-        records = r.json()["records"]
-        return MetricRecordList(group_by, records)
-    except requests.exceptions.HTTPError as errh:
-        logging.error(f"Http Error: {errh}")
-    except requests.exceptions.ConnectionError as errc:
-        logging.error(f"Error Connecting: {errc}")
-    except requests.exceptions.Timeout as errt:
-        logging.error(f"Timeout Error: {errt}")
-    except requests.exceptions.RequestException as err:
-        logging.error(f"Something went wrong: {err}")
-        sys.exit(1)
+    data, group_by = _metric_query_data(
+        indicator_id, from_ts, to_ts, group_by, aggregate, query_filter
+    )
+    payload = _post("/query-metrics", json=data)
+    if payload is None:
+        return None
+    return MetricRecordList(group_by, payload["records"])
 
 
 def query_streaming(
@@ -716,42 +894,10 @@ def query_streaming(
     Returns:
         MetricRecordList: An object that contains the list of records output by the query.
     """
-    if to_ts is None:
-        to_ts = datetime.datetime.now()
-    data_filter = {"operator": "or", "filters": []}
-    if group_by:
-        data_filter["group_by_clauses"] = group_by
-    else:
-        group_by = []
-    if query_filter:
-        data_filter["operator"] = query_filter.operator
-        data_filter["filters"] = [
-            {"field": clause.field, "operator": clause.operator, "value": clause.values}
-            for clause in query_filter.clauses
-        ]
-    data = {
-        "indicator_id": indicator_id,
-        "filter": data_filter,
-        "time_range": {
-            "from_ts": int(from_ts.timestamp() * 1000),
-            "to_ts": int(to_ts.timestamp() * 1000),
-        },
-    }
-    if aggregate:
-        data["aggregation"] = aggregate
-    try:
-        r = s.get(
-            url=f"{LARIAT_PUBLIC_API_ENDPOINT}/streaming-query-metrics", json=data
-        )
-        r.raise_for_status()
-        records = r.json()["records"]
-        return MetricRecordList(group_by, records)
-    except requests.exceptions.HTTPError as errh:
-        logging.error(f"Http Error: {errh}")
-    except requests.exceptions.ConnectionError as errc:
-        logging.error(f"Error Connecting: {errc}")
-    except requests.exceptions.Timeout as errt:
-        logging.error(f"Timeout Error: {errt}")
-    except requests.exceptions.RequestException as err:
-        logging.error(f"Something went wrong: {err}")
-        sys.exit(1)
+    data, group_by = _metric_query_data(
+        indicator_id, from_ts, to_ts, group_by, aggregate, query_filter
+    )
+    payload = _post("/streaming-query-metrics", json=data)
+    if payload is None:
+        return None
+    return MetricRecordList(group_by, payload["records"])
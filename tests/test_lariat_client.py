@@ -1,18 +1,13 @@
 import pytest
 import requests_mock
 from datetime import datetime
+from types import MappingProxyType
 from lariat_client import (
     configure,
-    Field,
-    Indicator,
-    RawDataset,
-    Dataset,
     FilterClause,
     Filter,
-    MetricRecord,
     MetricRecordList,
     get_raw_datasets,
-    get_dataset,
     get_datasets,
     get_indicators,
     get_indicator,
@@ -22,27 +17,23 @@ from lariat_client import (
 )
 
 
-# Mock API responses
-def mock_get_raw_datasets(mocker):
-    raw_datasets_response = {
-        "raw_datasets": [
+# Shared API response payloads, built once at import time and frozen so no
+# test can mutate what another test receives
+RAW_DATASETS_RESPONSE = MappingProxyType(
+    {
+        "raw_datasets": (
             {
                 "source_id": "123",
                 "data_source": "example",
                 "name": "Example Dataset",
                 "schema": {"example_field": "string"},
-            }
-        ]
+            },
+        )
     }
-    mocker.get(
-        f"{LARIAT_PUBLIC_API_ENDPOINT}/raw-datasets",
-        json=raw_datasets_response,
-    )
-
-
-def mock_get_datasets(mocker):
-    datasets_response = {
-        "computed_datasets": [
+)
+DATASETS_RESPONSE = MappingProxyType(
+    {
+        "computed_datasets": (
             {
                 "data_source": "example",
                 "source_id": "123",
@@ -50,60 +41,26 @@ def mock_get_datasets(mocker):
                 "id": 1,
                 "query": "SELECT * FROM example_dataset",
                 "schema": {"example_field": "string"},
-            }
-        ]
-    }
-    mocker.get(
-        f"{LARIAT_PUBLIC_API_ENDPOINT}/datasets",
-        json=datasets_response,
-    )
-
-
-def mock_get_indicators(mocker):
-    indicators_response = {
-        "indicators": [
-            {
-                "indicator_id": 1,
-                "computed_dataset_id": 1,
-                "computed_dataset_name": "Example Dataset",
-                "calculation": "COUNT(example_field)",
-                "filters": None,
-                "group_fields": None,
-                "aggregations": None,
-                "name": "Example Indicator",
-                "tags": [],
-            }
-        ]
+            },
+        )
     }
-    mocker.get(
-        f"{LARIAT_PUBLIC_API_ENDPOINT}/indicators",
-        json=indicators_response,
-    )
-
-
-def mock_get_indicator(mocker):
-    indicator_response = {
-        "indicator": {
-            "indicator_id": 1,
-            "computed_dataset_id": 1,
-            "computed_dataset_name": "Example Dataset",
-            "calculation": "COUNT(example_field)",
-            "filters": None,
-            "group_fields": None,
-            "aggregations": None,
-            "name": "Example Indicator",
-            "tags": [],
-        }
+)
+INDICATOR_OBJECT = MappingProxyType(
+    {
+        "indicator_id": 1,
+        "computed_dataset_id": 1,
+        "computed_dataset_name": "Example Dataset",
+        "calculation": "COUNT(example_field)",
+        "filters": None,
+        "group_fields": None,
+        "aggregations": None,
+        "name": "Example Indicator",
+        "tags": [],
     }
-    mocker.get(
-        f"{LARIAT_PUBLIC_API_ENDPOINT}/indicator",
-        json=indicator_response,
-    )
-
-
-def mock_query_metrics(mocker):
-    query_metrics_response = {
-        "records": [
+)
+QUERY_METRICS_RESPONSE = MappingProxyType(
+    {
+        "records": (
             {
                 "evaluation_time": 1633014000,
                 "value": 42.0,
@@ -114,118 +71,154 @@ def mock_query_metrics(mocker):
                 "value": 45.0,
                 "dimensions": {"country": "US", "state": "CA"},
             },
-        ]
+        )
     }
-    mocker.get(
-        f"{LARIAT_PUBLIC_API_ENDPOINT}/query-metrics",
-        json=query_metrics_response,
-    )
-
-
-# Test configure function
-def test_configure():
-    configure("test_api_key", "test_application_key")
-    assert (
-        s.headers["X-Lariat-Api-Key"] == "test_api_key"
-        and s.headers["X-Lariat-Application-Key"] == "test_application_key"
-    )
-
-
-# Test get_raw_datasets function
-def test_get_raw_datasets():
-    with requests_mock.Mocker() as mocker:
-        mock_get_raw_datasets(mocker)
-        raw_datasets = get_raw_datasets([1])
-        assert len(raw_datasets) == 1
-        assert raw_datasets[0].source_id == "123"
-        assert raw_datasets[0].data_source == "example"
-        assert raw_datasets[0].name == "Example Dataset"
-        assert raw_datasets[0].schema == {"example_field": "string"}
-
+)
 
-# Test get_datasets function
-def test_get_datasets():
-    with requests_mock.Mocker() as mocker:
-        mock_get_datasets(mocker)
-        datasets = get_datasets([1])
-        assert len(datasets) == 1
-        assert datasets[0].data_source == "example"
-        assert datasets[0].source_id == "123"
-        assert datasets[0].name == "Example Dataset"
-        assert datasets[0].id == 1
-        assert datasets[0].query == "SELECT * FROM example_dataset"
-        assert datasets[0].schema == {"example_field": "string"}
 
+@pytest.fixture(scope="module")
+def mock_api():
+    """Mocks every Lariat API endpoint the tests exercise.
 
-# Test get_indicator function
-def test_get_indicator():
+    Module-scoped so the mocker is installed and torn down once per run
+    rather than around every test.
+    """
+    # json= payloads go through json.dumps, which rejects mapping proxies,
+    # so unwrap the frozen constants with a shallow dict() copy here
     with requests_mock.Mocker() as mocker:
-        mock_get_indicator(mocker)
-        indicator = get_indicator(1)
-        assert indicator.id == 1
-        assert indicator.dataset_id == 1
-        assert indicator.dataset_name == "Example Dataset"
-        assert (
-            indicator.query
-            == 'SELECT COUNT(example_field) AS value FROM "Example Dataset"'
+        mocker.get(
+            f"{LARIAT_PUBLIC_API_ENDPOINT}/raw-datasets",
+            json=dict(RAW_DATASETS_RESPONSE),
         )
-        assert indicator.aggregations == None
-        assert indicator.name == "Example Indicator"
-        assert indicator.dimensions == None
-        assert indicator.tags == []
-
-
-# Test get_indicators function
+        mocker.get(
+            f"{LARIAT_PUBLIC_API_ENDPOINT}/datasets",
+            json=dict(DATASETS_RESPONSE),
+        )
+        mocker.get(
+            f"{LARIAT_PUBLIC_API_ENDPOINT}/indicators",
+            json={"indicators": [dict(INDICATOR_OBJECT)]},
+        )
+        mocker.get(
+            f"{LARIAT_PUBLIC_API_ENDPOINT}/indicator",
+            json={"indicator": dict(INDICATOR_OBJECT)},
+        )
+        mocker.post(
+            f"{LARIAT_PUBLIC_API_ENDPOINT}/query-metrics",
+            json=dict(QUERY_METRICS_RESPONSE),
+        )
+        yield mocker
 
 
-def test_get_indicators():
-    with requests_mock.Mocker() as mocker:
-        mock_get_indicators(mocker)
-        indicators = get_indicators()
-        assert len(indicators) == 1
-        assert indicators[0].id == 1
-        assert indicators[0].dataset_id == 1
-        assert indicators[0].dataset_name == "Example Dataset"
+# Test configure function
+def test_configure():
+    original_headers = dict(s.headers)
+    try:
+        configure("test_api_key", "test_application_key")
         assert (
-            indicators[0].query
-            == 'SELECT COUNT(example_field) AS value FROM "Example Dataset"'
+            s.headers["X-Lariat-Api-Key"] == "test_api_key"
+            and s.headers["X-Lariat-Application-Key"] == "test_application_key"
         )
-        assert indicators[0].aggregations == None
-        assert indicators[0].name == "Example Indicator"
-        assert indicators[0].dimensions == None
-        assert indicators[0].tags == []
+    finally:
+        s.headers.clear()
+        s.headers.update(original_headers)
+
+
+# Test the get_* functions against their mocked responses
+@pytest.mark.parametrize(
+    "fn, args, expected",
+    [
+        (
+            get_raw_datasets,
+            ([1],),
+            MappingProxyType({
+                "source_id": "123",
+                "data_source": "example",
+                "name": "Example Dataset",
+                "schema": {"example_field": "string"},
+            }),
+        ),
+        (
+            get_datasets,
+            ([1],),
+            MappingProxyType({
+                "data_source": "example",
+                "source_id": "123",
+                "name": "Example Dataset",
+                "id": 1,
+                "query": "SELECT * FROM example_dataset",
+                "schema": {"example_field": "string"},
+            }),
+        ),
+        (
+            get_indicator,
+            (1,),
+            MappingProxyType({
+                "id": 1,
+                "dataset_id": 1,
+                "dataset_name": "Example Dataset",
+                "query": 'SELECT COUNT(example_field) AS value FROM "Example Dataset"',
+                "aggregations": None,
+                "name": "Example Indicator",
+                "dimensions": None,
+                "tags": [],
+            }),
+        ),
+        (
+            get_indicators,
+            (),
+            MappingProxyType({
+                "id": 1,
+                "dataset_id": 1,
+                "dataset_name": "Example Dataset",
+                "query": 'SELECT COUNT(example_field) AS value FROM "Example Dataset"',
+                "aggregations": None,
+                "name": "Example Indicator",
+                "dimensions": None,
+                "tags": [],
+            }),
+        ),
+    ],
+    ids=["get_raw_datasets", "get_datasets", "get_indicator", "get_indicators"],
+)
+def test_get(mock_api, fn, args, expected):
+    result = fn(*args)
+    if isinstance(result, list):
+        assert len(result) == 1
+        result = result[0]
+    assert {attr: getattr(result, attr) for attr in expected} == expected
 
 
 # Test query function
-def test_query(monkeypatch):
-    with requests_mock.Mocker() as mocker:
-        mock_query_metrics(mocker)
-        indicator_id = 1
-        from_ts = datetime(2021, 9, 30)
-        to_ts = datetime(2021, 10, 1)
-        group_by = ["country", "state"]
-        aggregate = "sum"
-        query_filter = Filter(
-            clauses=[FilterClause(field="country", operator="eq", values="US")],
-            operator="AND",
-        )
-        output_format = "json"
+def test_query(mock_api):
+    indicator_id = 1
+    from_ts = datetime(2021, 9, 30)
+    to_ts = datetime(2021, 10, 1)
+    group_by = ["country", "state"]
+    aggregate = "sum"
+    query_filter = Filter(
+        clauses=[FilterClause(field="country", operator="eq", values="US")],
+        operator="AND",
+    )
+
+    result = query(
+        indicator_id,
+        from_ts,
+        to_ts,
+        group_by,
+        aggregate,
+        query_filter,
+    )
+
+    assert isinstance(result, MetricRecordList)
+    assert tuple(
+        {
+            "evaluation_time": record.evaluation_time,
+            "value": record.value,
+            "dimensions": record.dimensions,
+        }
+        for record in result.records
+    ) == QUERY_METRICS_RESPONSE["records"]
 
-        result = query(
-            indicator_id,
-            from_ts,
-            to_ts,
-            group_by,
-            aggregate,
-            query_filter,
-            output_format,
-        )
 
-        assert isinstance(result, MetricRecordList)
-        assert len(result.records) == 2
-        assert result.records[0].evaluation_time == 1633014000
-        assert result.records[0].value == 42.0
-        assert result.records[0].dimensions == {"country": "US", "state": "CA"}
-        assert result.records[1].evaluation_time == 1633017600
-        assert result.records[1].value == 45.0
-        assert result.records[1].dimensions == {"country": "US", "state": "CA"}
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))